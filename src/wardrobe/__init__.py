@@ -2,7 +2,15 @@
 Wardrobe management system for clothing inventory.
 """
 
-from .core.generator import WardrobeGenerator
-
 __version__ = "0.1.0"
-__all__ = ["WardrobeGenerator"]
\ No newline at end of file
+__all__ = ["WardrobeGenerator"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy re-export: an eager import here would defeat cli.py's
+    # deferred import, since the console script imports this package before
+    # wardrobe.cli and would pull googleapiclient/Pillow on every invocation
+    if name == "WardrobeGenerator":
+        from .core.generator import WardrobeGenerator
+        return WardrobeGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
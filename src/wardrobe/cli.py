@@ -3,26 +3,26 @@
 
 from pathlib import Path
 import argparse
+import logging
 import os
 import sys
 
-from .core.generator import WardrobeGenerator, generate_wardrobe_sites
-
 
 def main():
     """Main CLI entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     data_path = Path(os.getenv("HOME")) / "Data" / "wardrobe"
     code_path = Path(os.getenv("HOME")) / "Data" / "code"
-    source_data_path_str = str(data_path / "source_data")
+    source_data_path = data_path / "source_data"
 
     auth_path =  data_path / "auth"
-    output_path_str = str(data_path / "output")
+    output_path = data_path / "output"
 
-    creds_path_str = str(auth_path / "credentials.json")
-    readwrite_token_path_str = str(auth_path / "token.json")
-    readonly_token_path_str = str(auth_path / "token_readonly.json")
+    creds_path = auth_path / "credentials.json"
+    readwrite_token_path = auth_path / "token.json"
+    readonly_token_path = auth_path / "token_readonly.json"
 
-    site_template_path_str = str(code_path / "clothes" / "src" / "site_template")
+    site_template_path = code_path / "clothes" / "src" / "site_template"
 
     parser = argparse.ArgumentParser(description="Wardrobe management system")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
@@ -31,33 +31,37 @@ def main():
     gen_parser = subparsers.add_parser('generate', help='Generate wardrobe site')
     gen_parser.add_argument('--people', nargs='+', default=['eric', 'randi'],
                             help='People to generate sites for')
-    gen_parser.add_argument('--source', default=source_data_path_str,
+    gen_parser.add_argument('--source', type=Path, default=source_data_path,
                             help='Source data directory')
-    gen_parser.add_argument('--output', default=output_path_str,
+    gen_parser.add_argument('--output', type=Path, default=output_path,
                             help='Output directory')
-    gen_parser.add_argument('--template', default=site_template_path_str,
+    gen_parser.add_argument('--template', type=Path, default=site_template_path,
                             help='Site template directory')
     gen_parser.add_argument('--skip-images', action='store_true',
                             help='Skip image processing')
-    gen_parser.add_argument('--readwrite-token', default=readwrite_token_path_str,
+    gen_parser.add_argument('--force', action='store_true',
+                            help='Reprocess images even when outputs are up to date')
+    gen_parser.add_argument('--readwrite-token', type=Path, default=readwrite_token_path,
                             help='Read/write token path')
-    gen_parser.add_argument('--readonly-token', default=readonly_token_path_str,
+    gen_parser.add_argument('--readonly-token', type=Path, default=readonly_token_path,
                             help='Read-only token path')
-    gen_parser.add_argument('--creds', default=creds_path_str, help='Credentials path')
+    gen_parser.add_argument('--creds', type=Path, default=creds_path, help='Credentials path')
 
     # Single person generate
     single_parser = subparsers.add_parser('generate-single', help='Generate site for single person')
     single_parser.add_argument('person', help='Person name')
-    single_parser.add_argument('--source', default=source_data_path_str, help='Source data directory')
-    single_parser.add_argument('--output', default=output_path_str, help='Output directory')
-    single_parser.add_argument('--template', default=site_template_path_str, help='Template directory')
+    single_parser.add_argument('--source', type=Path, default=source_data_path, help='Source data directory')
+    single_parser.add_argument('--output', type=Path, default=output_path, help='Output directory')
+    single_parser.add_argument('--template', type=Path, default=site_template_path, help='Template directory')
     single_parser.add_argument('--sheet', help='Google Sheets name')
     single_parser.add_argument('--skip-images', action='store_true', help='Skip image processing')
-    single_parser.add_argument('--readwrite-token', default=readwrite_token_path_str,
+    single_parser.add_argument('--force', action='store_true',
+                               help='Reprocess images even when outputs are up to date')
+    single_parser.add_argument('--readwrite-token', type=Path, default=readwrite_token_path,
                                help='Read/write token path')
-    single_parser.add_argument('--readonly-token', default=readonly_token_path_str,
+    single_parser.add_argument('--readonly-token', type=Path, default=readonly_token_path,
                                help='Read-only token path')
-    single_parser.add_argument('--creds', default=creds_path_str, help='Credentials path')
+    single_parser.add_argument('--creds', type=Path, default=creds_path, help='Credentials path')
 
     args = parser.parse_args()
 
@@ -65,6 +69,10 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    # Imported after dispatch so `wardrobe --help` (and bad invocations)
+    # don't pay the googleapiclient/Pillow cold-import cost
+    from .core.generator import WardrobeGenerator, generate_wardrobe_sites
+
     try:
         if args.command == 'generate':
             generate_wardrobe_sites(
@@ -73,13 +81,14 @@ def main():
                 source_base=args.source,
                 site_template_dir=args.template,
                 skip_image_processing=args.skip_images,
-                readwrite_token_path=readwrite_token_path_str,
-                readonly_token_path=readonly_token_path_str,
-                creds_path=creds_path_str,
+                readwrite_token_path=args.readwrite_token,
+                readonly_token_path=args.readonly_token,
+                creds_path=args.creds,
+                force=args.force,
             )
         elif args.command == 'generate-single':
-            source_dir = args.source or f'source_data/{args.person}s-clothes'
-            output_dir = f'{args.output}/{args.person}s-clothes'
+            source_dir = args.source or Path(f'source_data/{args.person}s-clothes')
+            output_dir = args.output / f'{args.person}s-clothes'
             sheet_name = args.sheet or f'{args.person}-wardrobe'
 
             print(f'*** {output_dir=}')
@@ -89,10 +98,11 @@ def main():
                 output_dir=output_dir,
                 site_template_dir=args.template,
                 skip_image_processing=args.skip_images,
-                readwrite_token_path=readwrite_token_path_str,
-                readonly_token_path=readonly_token_path_str,
-                creds_path=creds_path_str,
-                metadata_sheetname=sheet_name
+                readwrite_token_path=args.readwrite_token,
+                readonly_token_path=args.readonly_token,
+                creds_path=args.creds,
+                metadata_sheetname=sheet_name,
+                force=args.force
             )
             generator.generate()
 
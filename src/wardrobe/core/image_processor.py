@@ -1,6 +1,11 @@
 """Image processing functionality for wardrobe items."""
 
+import logging
+import os
 import re
+import string
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -10,22 +15,72 @@ from pillow_heif import register_heif_opener
 # Register HEIF/HEIC support
 register_heif_opener()
 
+# logging instead of print: per-image chatter from pool workers no longer
+# serializes on the stdout lock, and the CLI controls verbosity centrally
+log = logging.getLogger(__name__)
+
+# Slugging maps [a-z0-9] to itself and everything else to '-'; str.translate
+# does that classification bytewise in C, much faster than a regex walk.
+# defaultdict supplies the '-' for any code point not listed (incl. non-ASCII)
+_SLUG_TRANS = defaultdict(lambda: '-', {ord(c): c for c in string.ascii_lowercase + string.digits})
+
+# Collapses the dash runs left behind by the translation
+_DASH_RE = re.compile(r'-{2,}')
+
+# Title-casing separators: one C-level pass instead of chained .replace calls
+_TITLE_TRANS = str.maketrans({'_': ' ', '-': ' '})
+
+# Supported image extensions (lowercase)
+_IMAGE_EXTENSIONS = frozenset({'.heic', '.jpg', '.jpeg', '.png', '.webp'})
+
+
+# Per-worker processor, created once by _init_worker rather than per task
+_worker_processor: Optional["ImageProcessor"] = None
+
+
+def _init_worker(thumbs_dir: Path, full_dir: Path, force: bool):
+    """
+    Set up a pool worker: register the HEIF opener and build the one
+    ImageProcessor this worker reuses for all its tasks. Constructing it
+    per image would mkdir the output dirs (and re-pickle the config) on
+    every task.
+    """
+    global _worker_processor
+    register_heif_opener()
+    _worker_processor = ImageProcessor(thumbs_dir=thumbs_dir, full_dir=full_dir, force=force)
+
+
+def _process_image_worker(image_path: Path, category: str,
+                          mtime: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Process a single image in a worker process.
+
+    Module-level so it is picklable for ProcessPoolExecutor; delegates to
+    the worker's shared processor built by _init_worker.
+    """
+    return _worker_processor.process_image(image_path, category, mtime=mtime)
+
 
 class ImageProcessor:
     """Handles image processing for wardrobe items."""
     
-    def __init__(self, thumbs_dir: Path, full_dir: Path, skip_processing: bool = False):
+    def __init__(self, thumbs_dir: Path, full_dir: Path, skip_processing: bool = False,
+                 max_workers: Optional[int] = None, force: bool = False):
         """
         Initialize image processor.
-        
+
         Args:
             thumbs_dir: Directory for thumbnail images
-            full_dir: Directory for full-size images  
+            full_dir: Directory for full-size images
             skip_processing: Skip actual image processing (for testing)
+            max_workers: Worker processes for the scan pool (default: all cores)
+            force: Reprocess images even when outputs are up to date
         """
         self.thumbs_dir = thumbs_dir
         self.full_dir = full_dir
         self.skip_processing = skip_processing
+        self.max_workers = max_workers or os.cpu_count()
+        self.force = force
         
         # Create output directories
         self.thumbs_dir.mkdir(parents=True, exist_ok=True)
@@ -36,7 +91,7 @@ class ImageProcessor:
         # Remove file extension and convert to lowercase
         slug = Path(filename).stem.lower()
         # Replace non-alphanumeric characters with hyphens
-        slug = re.sub(r'[^a-z0-9]+', '-', slug)
+        slug = _DASH_RE.sub('-', slug.translate(_SLUG_TRANS))
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
         return slug
@@ -45,73 +100,132 @@ class ImageProcessor:
         """Generate a human-readable title from filename."""
         # For now, just use the filename as title
         # This can be enhanced later to be more descriptive
-        title = filename.replace('_', ' ').replace('-', ' ')
-        return title
+        return filename.translate(_TITLE_TRANS)
 
-    def process_image(self, image_path: Path, category: str) -> Optional[Dict[str, Any]]:
+    def _build_item(self, image_path: Path, category: str, mtime: float) -> Dict[str, Any]:
+        """Build the item record for a processed image."""
+        base_name = image_path.stem
+        slug = self.generate_slug_from_filename(image_path.name)
+        return {
+            "id": slug,
+            "filename": image_path.name,
+            "slug": slug,
+            "title": self.generate_title_from_filename(base_name),
+            "category": category.lower(),
+            "thumbnail": f"images/thumbs/{base_name}.webp",
+            "image": f"images/full/{base_name}.jpg",
+            "tags": [category],
+            "notes": "",
+            "created_date": mtime
+        }
+
+    def process_image(self, image_path: Path, category: str,
+                      mtime: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Process a single image file.
-        
+
         Args:
             image_path: Path to the source image
             category: Category name for the item
-            
+            mtime: Source mtime if already known (e.g. from a DirEntry),
+                avoiding a redundant stat syscall
+
         Returns:
             Item dictionary or None if processing failed
         """
-        print(f"Processing {image_path.name}")
-        
+        log.info("Processing %s", image_path.name)
+
         try:
+            src_mtime = mtime if mtime is not None else image_path.stat().st_mtime
+
+            # In skip mode the item record only needs the path and stat, so
+            # don't pay for a decoder header parse (non-trivial for HEIC)
+            if self.skip_processing:
+                return self._build_item(image_path, category, src_mtime)
+
+            # Skip decode/resize/encode entirely when both outputs already
+            # exist, are non-empty (an interrupted save leaves a truncated
+            # file with a fresh mtime), and are at least as new as the
+            # source (incremental build). One stat per output covers the
+            # existence, size, and mtime checks; ENOENT means reprocess.
+            thumb_path = self.thumbs_dir / f"{image_path.stem}.webp"
+            full_path = self.full_dir / f"{image_path.stem}.jpg"
+            if not self.force:
+                try:
+                    thumb_stat = thumb_path.stat()
+                    full_stat = full_path.stat()
+                    if (thumb_stat.st_size > 0 and full_stat.st_size > 0
+                            and thumb_stat.st_mtime >= src_mtime
+                            and full_stat.st_mtime >= src_mtime):
+                        return self._build_item(image_path, category, src_mtime)
+                except OSError:
+                    pass
+
             # Open and convert image
             with Image.open(image_path) as img:
+                # Ask the decoder for a downscaled decode (DCT-domain 1/2,
+                # 1/4, 1/8 for JPEG) since we never need more than 1200px;
+                # a no-op for formats that don't support draft mode
+                img.draft('RGB', (1200, 1200))
+
                 # Convert HEIC to RGB if needed
-                if not self.skip_processing:
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                
-                # Generate filename without HEIC extension
-                base_name = image_path.stem
-                slug = self.generate_slug_from_filename(image_path.name)
-                
-                # Create thumbnail (300x300, maintain aspect ratio)
-                if not self.skip_processing:
-                    thumb = img.copy()
-                    thumb.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                    thumb_path = self.thumbs_dir / f"{base_name}.jpg"
-                    thumb.save(thumb_path, "JPEG", quality=85)
-                
-                # Create full-size web image (max 1200px width, maintain aspect ratio)
-                if not self.skip_processing:
-                    full = img.copy()
-                    if full.width > 1200:
-                        ratio = 1200 / full.width
-                        new_height = int(full.height * ratio)
-                        full = full.resize((1200, new_height), Image.Resampling.LANCZOS)
-                
-                full_path = self.full_dir / f"{base_name}.jpg"
-                if not self.skip_processing:
-                    full.save(full_path, "JPEG", quality=90)
-                
-                # Create item record
-                item = {
-                    "id": slug,
-                    "filename": image_path.name,
-                    "slug": slug,
-                    "title": self.generate_title_from_filename(base_name),
-                    "category": category.lower(),
-                    "thumbnail": f"images/thumbs/{base_name}.jpg",
-                    "image": f"images/full/{base_name}.jpg",
-                    "tags": [category],
-                    "notes": "",
-                    "created_date": image_path.stat().st_mtime
-                }
-                
-                return item
-                
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+
+                # Create full-size web image first (max 1200px width,
+                # maintain aspect ratio) directly from the decoded image
+                full = img
+                if full.width > 1200:
+                    ratio = 1200 / full.width
+                    new_height = int(full.height * ratio)
+                    full = full.resize((1200, new_height), Image.Resampling.LANCZOS)
+                # Derive the thumbnail (300x300, maintain aspect ratio) from
+                # the already-downscaled full image: resampling ~1200px is far
+                # cheaper than resampling the original full-resolution photo
+                thumb = full.copy()
+                # reducing_gap=2.0 lets thumbnail() pre-shrink with cheap
+                # integer reduction and only runs LANCZOS over the last 2x,
+                # which is visually indistinguishable at 300px
+                thumb.thumbnail((300, 300), Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+                # Pillow releases the GIL inside its C encoders, so the JPEG
+                # and WebP saves genuinely overlap on two threads. The full-
+                # size JPEG trades a little encode time for optimized Huffman
+                # tables and progressive scan (~5-10% smaller files served on
+                # every page view); WebP method=4 balances encode speed and
+                # size
+                with ThreadPoolExecutor(max_workers=2) as save_pool:
+                    saves = [
+                        save_pool.submit(full.save, full_path, "JPEG",
+                                         quality=90, optimize=True, progressive=True),
+                        save_pool.submit(thumb.save, thumb_path, "WEBP",
+                                         quality=80, method=4),
+                    ]
+                    for future in saves:
+                        future.result()
+
+            return self._build_item(image_path, category, src_mtime)
+
         except Exception as e:
-            print(f"Error processing {image_path.name}: {e}")
+            log.error("Error processing %s: %s", image_path.name, e)
             return None
 
+    def _prune_orphans(self, expected_stems: set):
+        """Delete outputs that this run will not produce.
+
+        Matches exact output filenames, not just stems, so stale formats
+        from older pipelines (e.g. a leftover X.jpg thumbnail beside the
+        X.webp this run writes) are pruned along with outputs whose source
+        image was deleted or renamed.
+        """
+        for out_dir, ext in ((self.thumbs_dir, '.webp'), (self.full_dir, '.jpg')):
+            expected_names = {stem + ext for stem in expected_stems}
+            with os.scandir(out_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name not in expected_names:
+                        log.info("Removing orphaned output %s", entry.name)
+                        os.unlink(entry.path)
+
     def scan_photos_directory(self, photos_dir: Path) -> list:
         """
         Scan the source_photos directory and process all images.
@@ -125,23 +239,63 @@ class ImageProcessor:
         items = []
         
         if not photos_dir.exists():
-            print(f"Source directory {photos_dir} not found!")
+            log.warning("Source directory %s not found!", photos_dir)
             return items
 
-        # Supported image extensions
-        image_extensions = {'.heic', '.jpg', '.jpeg', '.png', '.webp'}
-        
-        for category_dir in photos_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
-                
-            category_name = category_dir.name
-            print(f"\nProcessing category: {category_name}")
-            
-            for image_file in category_dir.iterdir():
-                if image_file.suffix.lower() in image_extensions:
-                    item = self.process_image(image_file, category_name)
-                    if item:
-                        items.append(item)
-        
+        # Collect (path, category) tasks first so they can be fanned out.
+        # os.scandir caches stat info from the directory read itself, so
+        # is_dir() and the extension check cost no extra syscalls per entry.
+        tasks = []
+        with os.scandir(photos_dir) as category_entries:
+            for category_entry in category_entries:
+                if not category_entry.is_dir(follow_symlinks=False):
+                    continue
+
+                category_name = category_entry.name
+                log.info("Processing category: %s", category_name)
+
+                with os.scandir(category_entry.path) as image_entries:
+                    for entry in image_entries:
+                        # rfind beats os.path.splitext here: no tuple or
+                        # intermediate string for non-matching names. dot > 0
+                        # keeps splitext's behavior for dotfiles like .DS_Store
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot > 0 and name[dot:].lower() in _IMAGE_EXTENSIONS:
+                            # DirEntry.stat() is served from the scandir
+                            # cache, so grabbing the mtime here saves a stat
+                            # per image later
+                            tasks.append((Path(entry.path), category_name,
+                                          entry.stat().st_mtime))
+
+        if not self.skip_processing:
+            # Outputs whose source photo has been deleted or renamed would
+            # otherwise accumulate forever now that the output tree is
+            # updated in place
+            self._prune_orphans({image_file.stem for image_file, _, _ in tasks})
+
+        if self.skip_processing:
+            # No CPU-bound work to parallelize; keep the simple serial path
+            for image_file, category_name, src_mtime in tasks:
+                item = self.process_image(image_file, category_name, mtime=src_mtime)
+                if item:
+                    items.append(item)
+            return items
+
+        # Each image is independent and CPU-bound (decode + resize + encode),
+        # so fan out across all cores
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.thumbs_dir, self.full_dir, self.force)) as executor:
+            # map with a chunksize amortizes pickling/IPC over several images
+            # per round-trip instead of one future per image
+            results = executor.map(
+                _process_image_worker,
+                [image_file for image_file, _, _ in tasks],
+                [category_name for _, category_name, _ in tasks],
+                [src_mtime for _, _, src_mtime in tasks],
+                chunksize=4,
+            )
+            items.extend(item for item in results if item)
+
         return items
\ No newline at end of file
@@ -40,6 +40,10 @@ class GoogleSheetsAuth:
         self.credentials_path = Path(credentials_path).resolve()
         self.readonly_token_path = Path(readonly_token_path).resolve()
         self.readwrite_token_path = Path(readwrite_token_path).resolve()
+        # Built service clients, keyed by scope tuple, so repeated calls
+        # reuse the same HTTP transport instead of re-reading tokens and
+        # opening fresh TLS connections
+        self._service_cache = {}
     
     def _get_credentials(self, scopes: List[str], token_path: Path) -> Credentials:
         """Get or refresh Google credentials for given scopes."""
@@ -71,26 +75,43 @@ class GoogleSheetsAuth:
         
         return creds
     
+    def _get_services(self, scopes: List[str], token_path: Path) -> Tuple:
+        """Get (and cache) Sheets and Drive service clients for given scopes."""
+        key = tuple(scopes)
+        services = self._service_cache.get(key)
+        if services is None:
+            creds = self._get_credentials(scopes, token_path)
+            sheets = build("sheets", "v4", credentials=creds, cache_discovery=False)
+            drive = build("drive", "v3", credentials=creds, cache_discovery=False)
+            services = (sheets, drive)
+            self._service_cache[key] = services
+        return services
+
+    def new_readonly_sheets_service(self):
+        """
+        Build a fresh read-only Sheets client with its own HTTP transport.
+
+        The cached services share one httplib2 transport, which is not
+        thread-safe; callers issuing concurrent requests need one of these
+        per thread.
+        """
+        creds = self._get_credentials(self.READONLY_SCOPES, self.readonly_token_path)
+        return build("sheets", "v4", credentials=creds, cache_discovery=False)
+
     def get_readonly_services(self) -> Tuple:
         """
         Get read-only Sheets and Drive service clients.
-        
+
         Returns:
             Tuple of (sheets_service, drive_service)
         """
-        creds = self._get_credentials(self.READONLY_SCOPES, self.readonly_token_path)
-        sheets = build("sheets", "v4", credentials=creds)
-        drive = build("drive", "v3", credentials=creds)
-        return sheets, drive
-    
+        return self._get_services(self.READONLY_SCOPES, self.readonly_token_path)
+
     def get_readwrite_services(self) -> Tuple:
         """
         Get read/write Sheets and Drive service clients.
-        
+
         Returns:
             Tuple of (sheets_service, drive_service)
         """
-        creds = self._get_credentials(self.READWRITE_SCOPES, self.readwrite_token_path)
-        sheets = build("sheets", "v4", credentials=creds)
-        drive = build("drive", "v3", credentials=creds)
-        return sheets, drive
\ No newline at end of file
+        return self._get_services(self.READWRITE_SCOPES, self.readwrite_token_path)
\ No newline at end of file
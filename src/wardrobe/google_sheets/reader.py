@@ -1,11 +1,19 @@
 """Google Sheets reading functionality."""
 
-from typing import Dict, List, Tuple, Any
+import calendar
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
+from functools import lru_cache
 
 from .auth import GoogleSheetsAuth
 from .sheet_utils import SheetUtils
 
+# Splits tag cells on commas and eats surrounding whitespace in the same
+# pass, so the per-part strip() disappears from the row hot loop
+_COMMA_RE = re.compile(r'\s*,\s*')
+
 
 # Expected base headers (row 1), produced by the writer script
 BASE_HEADERS = [
@@ -21,31 +29,73 @@ BASE_HEADERS = [
 ]
 
 
+@lru_cache(maxsize=8192)
+def _iso_to_epoch(s: str) -> int:
+    """Parse an ISO-8601 string to epoch seconds, caching per unique string."""
+    try:
+        # Fast path for the writer's own fixed format
+        # (YYYY-MM-DDTHH:MM:SS[.ffffff]Z): integer slicing plus timegm skips
+        # datetime construction and tz handling entirely
+        if (len(s) in (20, 27) and s[-1] == 'Z'
+                and s[4] == '-' and s[7] == '-' and s[10] == 'T'
+                and s[13] == ':' and s[16] == ':'):
+            return calendar.timegm((
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                0, 0, 0,
+            ))
+        # Support trailing 'Z'
+        if s.endswith("Z"):
+            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        else:
+            dt = datetime.fromisoformat(s)
+        return int(dt.timestamp())
+    except Exception:
+        return 0
+
+
+def column_letter(n: int) -> str:
+    """Convert a 1-based column number to its A1 letter(s), e.g. 1 -> 'A', 27 -> 'AA'."""
+    letters = ""
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+
 class SheetsReader:
     """Handles reading data from Google Sheets."""
-    
+
     def __init__(self, auth: GoogleSheetsAuth):
         """Initialize with authentication manager."""
         self.auth = auth
 
 
-    def get_first_sheet_title(self, sheets, spreadsheet_id: str) -> str:
-        """Get the title of the first sheet in a spreadsheet."""
+    def get_first_sheet_properties(self, sheets, spreadsheet_id: str) -> Tuple[str, int, int]:
+        """Get the title and grid size (rows, columns) of the first sheet."""
         meta = sheets.spreadsheets().get(
             spreadsheetId=spreadsheet_id,
-            fields="sheets(properties(title))",
+            fields="sheets(properties(title,gridProperties(rowCount,columnCount)))",
         ).execute()
         sheet_props = meta.get("sheets", [])
         if not sheet_props:
             raise RuntimeError("Spreadsheet has no sheets.")
-        return sheet_props[0]["properties"]["title"]
-    
-    def read_all_values(self, sheets, spreadsheet_id: str, sheet_title: str) -> List[List[str]]:
+        props = sheet_props[0]["properties"]
+        grid = props.get("gridProperties", {})
+        return props["title"], grid.get("rowCount", 100000), grid.get("columnCount", 702)
+
+    def get_first_sheet_title(self, sheets, spreadsheet_id: str) -> str:
+        """Get the title of the first sheet in a spreadsheet."""
+        return self.get_first_sheet_properties(sheets, spreadsheet_id)[0]
+
+    def read_all_values(self, sheets, spreadsheet_id: str, sheet_title: str,
+                        row_count: int = 100000, column_count: int = 702) -> List[List[str]]:
         """
-        Read all values from the first sheet. We read a generous range.
+        Read all values from the first sheet, bounded by the sheet's grid size.
         """
-        # A very wide range to capture all columns/rows that might have data
-        rng = f"'{sheet_title}'!A1:ZZ100000"
+        # Request only the sheet's actual grid instead of a huge sparse range;
+        # the API serializes every requested cell, so a tight range is much cheaper
+        rng = f"'{sheet_title}'!A1:{column_letter(column_count)}{row_count}"
         resp = sheets.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
             range=rng,
@@ -53,6 +103,27 @@ class SheetsReader:
         ).execute()
         return resp.get("values", [])
 
+    def read_sheet_grid(self, sheets, spreadsheet_id: str) -> List[List[str]]:
+        """
+        Fetch the first sheet's cell values in a single API call.
+
+        Uses includeGridData so the grid arrives with the spreadsheet
+        metadata, saving the separate values.get round-trip.
+        """
+        resp = sheets.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            includeGridData=True,
+            fields="sheets(data(rowData(values(formattedValue))))",
+        ).execute()
+        sheet_list = resp.get("sheets", [])
+        if not sheet_list:
+            raise RuntimeError("Spreadsheet has no sheets.")
+        row_data = sheet_list[0].get("data", [{}])[0].get("rowData", [])
+        return [
+            [cell.get("formattedValue", "") for cell in row.get("values", [])]
+            for row in row_data
+        ]
+
     def locate_tag_block(self, header_row1: List[str], header_row2: List[str]) -> Tuple[int, List[str]]:
         """
         Using the two-row header:
@@ -87,20 +158,12 @@ class SheetsReader:
     def parse_iso_to_epoch(self, iso_str: str) -> int:
         """
         Convert an ISO-8601 string (with 'Z' or offset) to epoch seconds (int).
-        Returns 0 if empty or unparsable.
+        Returns 0 if empty or unparsable. Results are cached per unique string
+        since sheets commonly repeat timestamps across rows.
         """
         if not iso_str:
             return 0
-        s = iso_str.strip()
-        try:
-            # Support trailing 'Z'
-            if s.endswith("Z"):
-                dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-            else:
-                dt = datetime.fromisoformat(s)
-            return int(dt.timestamp())
-        except Exception:
-            return 0
+        return _iso_to_epoch(iso_str.strip())
 
     def assemble_tags_from_row(self, row: List[str], tag_start: int, tag_types: List[str]) -> List[str]:
         """
@@ -109,50 +172,50 @@ class SheetsReader:
           - For type '----' and cell 'Shirt, Cotton' -> ['Shirt', 'Cotton']
         """
         tags: List[str] = []
+        row_len = len(row)
         for offset, tag_type in enumerate(tag_types):
             col_idx = tag_start + offset
-            cell = row[col_idx].strip() if col_idx < len(row) and row[col_idx] is not None else ""
+            cell = row[col_idx].strip() if col_idx < row_len and row[col_idx] is not None else ""
             if not cell:
                 continue
-            # Split on commas, keep order
-            parts = [p.strip() for p in cell.split(",") if p.strip()]
-            if tag_type == "----":
-                tags.extend(parts)
-            else:
-                for p in parts:
-                    tags.append(f"{tag_type}:{p}")
+            # One prefix per cell instead of an f-string per tag
+            prefix = "" if tag_type == "----" else tag_type + ":"
+            # The regex split strips whitespace around each part; the cell is
+            # already stripped at the ends, so only empty parts need filtering
+            tags.extend(prefix + p for p in _COMMA_RE.split(cell) if p)
         return tags
 
     def row_to_item(
             self,
             row: List[str],
-            base_idx: Dict[str, int],
+            base_indices: Tuple[int, ...],
             tag_start: int,
             tag_types: List[str],
     ) -> Dict:
         """
         Convert one sheet row into an 'item' dict in the original JSON shape.
+
+        base_indices holds the column index of each BASE_HEADERS entry
+        (-1 when absent), resolved once per sheet rather than per row.
         """
-        def get(name: str) -> str:
-            i = base_idx.get(name, -1)
-            return (row[i] if (i >= 0 and i < len(row)) else "").strip()
-
-        created_iso = get("Created (UTC ISO8601)")
-        created_epoch = self.parse_iso_to_epoch(created_iso)
-
-        item = {
-            "id": get("ID"),
-            "title": get("Title"),
-            "category": get("Category"),
-            "filename": get("Filename"),
-            "slug": get("Slug"),
-            "thumbnail": get("Thumbnail"),
-            "image": get("Image"),
-            "notes": get("Notes"),
-            "created_date": created_epoch,
+        row_len = len(row)
+        (id_val, title, category, filename, slug, thumbnail, image, notes, created_iso) = (
+            row[i].strip() if 0 <= i < row_len and row[i] else ""
+            for i in base_indices
+        )
+
+        return {
+            "id": id_val,
+            "title": title,
+            "category": category,
+            "filename": filename,
+            "slug": slug,
+            "thumbnail": thumbnail,
+            "image": image,
+            "notes": notes,
+            "created_date": self.parse_iso_to_epoch(created_iso),
             "tags": self.assemble_tags_from_row(row, tag_start, tag_types),
         }
-        return item
 
     def sheet_to_items(self, values: List[List[str]]) -> List[Dict]:
         """
@@ -168,17 +231,75 @@ class SheetsReader:
 
         tag_start, tag_types = self.locate_tag_block(row1, row2)
         base_idx = self.map_base_columns(row1)
+        # Resolve each base header's column index once for the whole sheet
+        base_indices = tuple(base_idx.get(name, -1) for name in BASE_HEADERS)
 
         items: List[Dict] = []
         for row in values[2:]:
             # skip entirely blank rows
             if not any((cell or "").strip() for cell in row):
                 continue
-            it = self.row_to_item(row, base_idx, tag_start, tag_types)
+            it = self.row_to_item(row, base_indices, tag_start, tag_types)
             items.append(it)
 
         return items
 
+    def read_many(self, parent_folder_id: str, sheet_names: List[str],
+                  known_modified_times: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Read several sheets from one folder, sharing a single Drive lookup.
+
+        Args:
+            parent_folder_id: Google Drive folder ID containing the sheets
+            sheet_names: Names of the spreadsheet files
+            known_modified_times: {sheet_name: RFC3339 modifiedTime} from a
+                previous run; sheets whose current modifiedTime matches are
+                not fetched and are absent from the result, signalling the
+                caller to reuse its local copy
+
+        Returns:
+            {sheet_name: {item_id: item}} — names missing from the folder
+            map to an empty dict rather than raising; names skipped as
+            unchanged are absent
+        """
+        sheets, drive = self.auth.get_readonly_services()
+
+        print(f"Looking for {sheet_names} in folder {parent_folder_id}...")
+        name_to_meta = SheetUtils.find_sheets_in_folder(drive, parent_folder_id, sheet_names)
+
+        known = known_modified_times or {}
+        results: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for name in sheet_names:
+            meta = name_to_meta.get(name)
+            if meta is None:
+                print(f"Warning: Sheet named '{name}' not found in folder {parent_folder_id}.")
+                results[name] = {}
+                continue
+            spreadsheet_id, modified_time = meta
+            if modified_time and known.get(name) == modified_time:
+                print(f"Sheet '{name}' unchanged; skipping fetch")
+                continue
+            to_fetch.append((name, spreadsheet_id))
+
+        if len(to_fetch) > 1:
+            # Each grid fetch is an independent round-trip; overlap them on
+            # threads, giving each thread its own client because the shared
+            # one's httplib2 transport is not thread-safe
+            def fetch(spreadsheet_id: str) -> List[List[str]]:
+                return self.read_sheet_grid(
+                    self.auth.new_readonly_sheets_service(), spreadsheet_id)
+
+            with ThreadPoolExecutor(max_workers=len(to_fetch)) as pool:
+                grids = list(pool.map(fetch, [sid for _, sid in to_fetch]))
+        else:
+            grids = [self.read_sheet_grid(sheets, sid) for _, sid in to_fetch]
+
+        for (name, _), values in zip(to_fetch, grids):
+            items = self.sheet_to_items(values)
+            results[name] = {item['id']: item for item in items}
+        return results
+
     def read_sheet_data(self, parent_folder_id: str, sheet_name: str) -> Dict[str, Any]:
         """
         Read data from a Google Sheet and return as item dictionary.
@@ -195,8 +316,7 @@ class SheetsReader:
         print(f"Looking for '{sheet_name}' in folder {parent_folder_id}...")
         spreadsheet_id = SheetUtils.find_sheet_in_folder(drive, parent_folder_id, sheet_name)
 
-        sheet_title = self.get_first_sheet_title(sheets, spreadsheet_id)
-        values = self.read_all_values(sheets, spreadsheet_id, sheet_title)
+        values = self.read_sheet_grid(sheets, spreadsheet_id)
 
         items = self.sheet_to_items(values)
         id_to_items = {}
@@ -1,5 +1,12 @@
 """Google Sheets utility functions."""
 
+from typing import Dict, List, Tuple
+
+
+def _escape_query_value(value: str) -> str:
+    """Escape a value for interpolation into a Drive search query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
 
 class SheetUtils:
     """Utility functions for working with Google Sheets."""
@@ -11,16 +18,50 @@ class SheetUtils:
         Raises FileNotFoundError if not found.
         """
         q = (
-            f"name = '{filename}' and "
-            f"'{folder_id}' in parents and "
+            f"name = '{_escape_query_value(filename)}' and "
+            f"'{_escape_query_value(folder_id)}' in parents and "
+            f"mimeType = 'application/vnd.google-apps.spreadsheet' and "
+            f"trashed = false"
+        )
+        # Ask for exactly the one field of the one file we use; orderBy makes
+        # the duplicate-name tiebreak deterministic (newest wins) instead of
+        # whatever Drive happens to return first
+        resp = drive.files().list(
+            q=q,
+            spaces="drive",
+            fields="files(id)",
+            pageSize=1,
+            orderBy="modifiedTime desc",
+        ).execute()
+        files = resp.get("files", [])
+
+        if not files:
+            raise FileNotFoundError(
+                f"Sheet named '{filename}' not found in folder {folder_id}."
+            )
+        return files[0]["id"]
+
+    @staticmethod
+    def find_sheet_with_modified_time(drive, folder_id: str, filename: str) -> Tuple[str, str]:
+        """
+        Return (file ID, RFC3339 modifiedTime) for a named spreadsheet
+        within `folder_id`. Raises FileNotFoundError if not found.
+
+        The modifiedTime rides along on the same files.list call, so change
+        detection costs no extra round-trip over the plain lookup.
+        """
+        q = (
+            f"name = '{_escape_query_value(filename)}' and "
+            f"'{_escape_query_value(folder_id)}' in parents and "
             f"mimeType = 'application/vnd.google-apps.spreadsheet' and "
             f"trashed = false"
         )
         resp = drive.files().list(
             q=q,
             spaces="drive",
-            fields="files(id, name)",
-            pageSize=10,
+            fields="files(id, modifiedTime)",
+            pageSize=1,
+            orderBy="modifiedTime desc",
         ).execute()
         files = resp.get("files", [])
 
@@ -28,5 +69,38 @@ class SheetUtils:
             raise FileNotFoundError(
                 f"Sheet named '{filename}' not found in folder {folder_id}."
             )
-        # If multiple, take the first
-        return files[0]["id"]
\ No newline at end of file
+        return files[0]["id"], files[0].get("modifiedTime", "")
+
+    @staticmethod
+    def find_sheets_in_folder(drive, folder_id: str,
+                              filenames: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Return {filename: (file ID, RFC3339 modifiedTime)} for all named
+        spreadsheets within `folder_id`.
+
+        Issues a single files.list call with the names OR-ed together, so the
+        Drive round-trip cost stays constant regardless of how many sheets
+        are looked up; the modifiedTime rides along for free, letting
+        callers skip fetches for unchanged sheets. Names missing from the
+        folder are absent from the result rather than raising.
+        """
+        name_clauses = " or ".join(
+            f"name = '{_escape_query_value(name)}'" for name in filenames)
+        q = (
+            f"({name_clauses}) and "
+            f"'{_escape_query_value(folder_id)}' in parents and "
+            f"mimeType = 'application/vnd.google-apps.spreadsheet' and "
+            f"trashed = false"
+        )
+        resp = drive.files().list(
+            q=q,
+            spaces="drive",
+            fields="files(id, name, modifiedTime)",
+            pageSize=len(filenames) * 10,
+        ).execute()
+
+        name_to_meta: Dict[str, Tuple[str, str]] = {}
+        for file in resp.get("files", []):
+            # If multiple share a name, keep the first
+            name_to_meta.setdefault(file["name"], (file["id"], file.get("modifiedTime", "")))
+        return name_to_meta
\ No newline at end of file
@@ -4,24 +4,39 @@ Simple HTTP server to serve the wardrobe website locally
 """
 
 import http.server
-import socketserver
 import os
 from pathlib import Path
 
+
+class WardrobeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Request handler with keep-alive and cache headers for static assets."""
+
+    # HTTP/1.1 enables persistent connections, so a browser's parallel
+    # thumbnail fetches reuse sockets instead of reconnecting per file
+    protocol_version = "HTTP/1.1"
+
+    def end_headers(self):
+        # Images are immutable per generation run; let the browser cache
+        # them so grid reloads don't re-fetch every thumbnail
+        if self.path.startswith("/images/"):
+            self.send_header("Cache-Control", "public, max-age=3600")
+        super().end_headers()
+
+
 def serve_website(port=8000):
     """Serve the website from the output directory"""
     output_dir = Path("/Users/ericmelz/Data/wardrobe/output")
-    
+
     if not output_dir.exists():
         print("Output directory not found. Please run generate_site.py first.")
         return
-    
+
     # Change to output directory to serve files
     os.chdir(output_dir)
-    
-    handler = http.server.SimpleHTTPRequestHandler
-    
-    with socketserver.TCPServer(("", port), handler) as httpd:
+
+    # ThreadingHTTPServer answers the browser's ~6 parallel connections
+    # concurrently instead of serializing the whole thumbnail grid
+    with http.server.ThreadingHTTPServer(("", port), WardrobeRequestHandler) as httpd:
         print(f"Serving wardrobe website at http://localhost:{port}/")
         print("Press Ctrl+C to stop the server")
         try:
@@ -11,7 +11,7 @@ def temp_dir(tmp_path):
     return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_data():
     """Sample image data for testing."""
     return {
@@ -36,15 +36,19 @@ def mock_google_services():
     return sheets_mock, drive_mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sheet_values():
-    """Sample spreadsheet values for testing."""
-    return [
+    """Sample spreadsheet values for testing.
+
+    Session-scoped and tuple-based so the instance is shared across tests;
+    accidental mutation raises instead of leaking between tests.
+    """
+    return (
         # Header rows
-        ["ID", "Title", "Category", "Filename", "Slug", "Thumbnail", "Image", "Notes", "Created (UTC ISO8601)", "Tags", "", ""],
-        ["", "", "", "", "", "", "", "", "", "color", "size", "----"],
+        ("ID", "Title", "Category", "Filename", "Slug", "Thumbnail", "Image", "Notes", "Created (UTC ISO8601)", "Tags", "", ""),
+        ("", "", "", "", "", "", "", "", "", "color", "size", "----"),
         # Data rows
-        ["test-shirt", "Test Shirt", "shirts", "test_shirt.jpg", "test-shirt", 
-         "images/thumbs/test_shirt.jpg", "images/full/test_shirt.jpg", "A test shirt", 
-         "2009-02-13T23:31:30Z", "blue", "medium", "Cotton"]
-    ]
\ No newline at end of file
+        ("test-shirt", "Test Shirt", "shirts", "test_shirt.jpg", "test-shirt",
+         "images/thumbs/test_shirt.jpg", "images/full/test_shirt.jpg", "A test shirt",
+         "2009-02-13T23:31:30Z", "blue", "medium", "Cotton")
+    )
\ No newline at end of file
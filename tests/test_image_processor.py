@@ -1,12 +1,21 @@
 """Tests for image processing functionality."""
 
+import os
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
+from PIL import Image
+
 from wardrobe.core.image_processor import ImageProcessor
 
 
+def make_image(path, size=(64, 48)):
+    """Write a small real image for processing tests."""
+    Image.new("RGB", size, (120, 80, 40)).save(path)
+
+
 class TestImageProcessor:
     """Test ImageProcessor functionality."""
     
@@ -75,6 +84,91 @@ class TestImageProcessor:
         # Verify PIL wasn't called for actual processing since skip_processing=True
         mock_img.save.assert_not_called()
 
+    def test_process_image_skips_fresh_outputs(self, temp_dir):
+        """Test that up-to-date outputs short-circuit the decode/encode."""
+        processor = ImageProcessor(temp_dir / "thumbs", temp_dir / "full")
+        image_path = temp_dir / "shirt.jpg"
+        make_image(image_path)
+
+        assert processor.process_image(image_path, "shirts") is not None
+
+        # Second run must not touch PIL at all
+        with patch('wardrobe.core.image_processor.Image') as mock_image:
+            result = processor.process_image(image_path, "shirts")
+
+        assert result is not None
+        assert result["id"] == "shirt"
+        mock_image.open.assert_not_called()
+
+    def test_process_image_reprocesses_stale_output(self, temp_dir):
+        """Test that outputs older than the source are regenerated."""
+        processor = ImageProcessor(temp_dir / "thumbs", temp_dir / "full")
+        image_path = temp_dir / "shirt.jpg"
+        make_image(image_path)
+        processor.process_image(image_path, "shirts")
+
+        # Backdate the thumbnail so it predates the source
+        thumb_path = temp_dir / "thumbs" / "shirt.webp"
+        old = image_path.stat().st_mtime - 100
+        os.utime(thumb_path, (old, old))
+
+        processor.process_image(image_path, "shirts")
+        assert thumb_path.stat().st_mtime >= image_path.stat().st_mtime
+
+    def test_process_image_reprocesses_truncated_output(self, temp_dir):
+        """Test that an empty output (interrupted save) is regenerated."""
+        processor = ImageProcessor(temp_dir / "thumbs", temp_dir / "full")
+        image_path = temp_dir / "shirt.jpg"
+        make_image(image_path)
+        processor.process_image(image_path, "shirts")
+
+        # A crash mid-save leaves a truncated file with a fresh mtime
+        full_path = temp_dir / "full" / "shirt.jpg"
+        full_path.write_bytes(b"")
+
+        processor.process_image(image_path, "shirts")
+        assert full_path.stat().st_size > 0
+
+    def test_process_image_force_reprocesses(self, temp_dir):
+        """Test that force=True bypasses the up-to-date check."""
+        processor = ImageProcessor(temp_dir / "thumbs", temp_dir / "full")
+        image_path = temp_dir / "shirt.jpg"
+        make_image(image_path)
+        processor.process_image(image_path, "shirts")
+
+        forced = ImageProcessor(temp_dir / "thumbs", temp_dir / "full", force=True)
+        with patch('wardrobe.core.image_processor.Image') as mock_image:
+            mock_img = MagicMock()
+            mock_img.mode = 'RGB'
+            mock_image.open.return_value.__enter__.return_value = mock_img
+            forced.process_image(image_path, "shirts")
+
+        mock_image.open.assert_called_once()
+
+    def test_scan_prunes_orphaned_outputs(self, temp_dir):
+        """Test that outputs with no matching source are deleted on scan."""
+        thumbs_dir = temp_dir / "thumbs"
+        full_dir = temp_dir / "full"
+        processor = ImageProcessor(thumbs_dir, full_dir, max_workers=1)
+
+        category_dir = temp_dir / "photos" / "shirts"
+        category_dir.mkdir(parents=True)
+        make_image(category_dir / "shirt1.jpg")
+
+        # Leftovers: a deleted source's outputs and an old-format thumbnail
+        (thumbs_dir / "deleted.webp").write_bytes(b"x")
+        (full_dir / "deleted.jpg").write_bytes(b"x")
+        (thumbs_dir / "shirt1.jpg").write_bytes(b"x")
+
+        items = processor.scan_photos_directory(temp_dir / "photos")
+
+        assert len(items) == 1
+        assert not (thumbs_dir / "deleted.webp").exists()
+        assert not (full_dir / "deleted.jpg").exists()
+        assert not (thumbs_dir / "shirt1.jpg").exists()
+        assert (thumbs_dir / "shirt1.webp").exists()
+        assert (full_dir / "shirt1.jpg").exists()
+
     def test_scan_photos_directory_nonexistent(self, temp_dir):
         """Test scanning a non-existent photos directory."""
         processor = ImageProcessor(temp_dir, temp_dir, skip_processing=True)